@@ -40,6 +40,22 @@ class SessionStartResponse(BaseModel):
     level: int
     objective: int
     lives: int
+    class_id: Optional[str] = None
+
+class SessionSummary(BaseModel):
+    session_id: str
+    current_level: int
+    current_objective: int
+    lives_remaining: int
+    status: str
+    class_id: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
+    attempts_count: int
+
+class SessionListResponse(BaseModel):
+    sessions: List[SessionSummary]
+    next_cursor: Optional[str] = None
 
 class HealthResponse(BaseModel):
     status: str
@@ -64,4 +80,5 @@ class GameSession(BaseModel):
     created_at: datetime
     updated_at: datetime
     status: str  # "active", "completed", "game_over"
-    attempts: List[GameAttempt] = []
\ No newline at end of file
+    attempts: List[GameAttempt] = []
+    class_id: Optional[str] = None  # Classroom the session reports progress to
\ No newline at end of file
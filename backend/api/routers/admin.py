@@ -0,0 +1,66 @@
+import hmac
+import os
+from datetime import datetime
+from typing import Optional
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from api.models import SessionListResponse, SessionSummary
+from api.services.session_service import session_service
+
+router = APIRouter()
+
+async def require_admin_token(x_admin_token: Optional[str] = Header(None, alias="X-Admin-Token")):
+    """Allow the request only with an X-Admin-Token matching ADMIN_API_KEY"""
+    admin_api_key = os.getenv("ADMIN_API_KEY")
+    if not admin_api_key:
+        # Admin routes do not exist unless a key is configured
+        raise HTTPException(status_code=404, detail="Not Found")
+    
+    if not x_admin_token or not hmac.compare_digest(x_admin_token.encode(), admin_api_key.encode()):
+        raise HTTPException(status_code=403, detail="Invalid admin token")
+
+@router.get("/admin/sessions", response_model=SessionListResponse,
+            dependencies=[Depends(require_admin_token)])
+async def list_sessions(
+    status: Optional[str] = None,
+    level: Optional[int] = None,
+    updated_since: Optional[datetime] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=500)
+):
+    """List sessions least recently updated first, one cursor-paginated page at a time"""
+    try:
+        if status is not None and status not in ["active", "completed", "game_over"]:
+            raise HTTPException(status_code=400, detail="Status must be active, completed or game_over")
+        
+        if cursor is not None and not (cursor.isascii() and cursor.isdigit()):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        
+        sessions, next_cursor = session_service.list_sessions(
+            status=status,
+            level=level,
+            updated_since=updated_since,
+            cursor=cursor,
+            limit=limit
+        )
+        
+        return SessionListResponse(
+            sessions=[
+                SessionSummary(
+                    session_id=session.session_id,
+                    current_level=session.current_level,
+                    current_objective=session.current_objective,
+                    lives_remaining=session.lives_remaining,
+                    status=session.status,
+                    class_id=session.class_id,
+                    created_at=session.created_at,
+                    updated_at=session.updated_at,
+                    attempts_count=len(session.attempts)
+                )
+                for session in sessions
+            ],
+            next_cursor=next_cursor
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to list sessions: {str(e)}")
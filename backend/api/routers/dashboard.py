@@ -0,0 +1,32 @@
+import json
+from fastapi import APIRouter, Request
+from fastapi.responses import StreamingResponse
+from api.services.session_event_bus import session_event_bus
+
+router = APIRouter()
+
+# Seconds between keep-alive comments when a class is idle
+HEARTBEAT_SECONDS = 15.0
+
+@router.get("/class/{class_id}/events")
+async def stream_class_events(class_id: str, request: Request):
+    """Stream coalesced session progress deltas for a class as server-sent events"""
+    async def event_stream():
+        # Subscribe inside the generator so unsubscribe always shares its lifetime
+        subscription = session_event_bus.subscribe(class_id)
+        try:
+            yield ": connected\n\n"
+            while not await request.is_disconnected():
+                batch = await subscription.next_batch(timeout=HEARTBEAT_SECONDS)
+                if not batch:
+                    yield ": keep-alive\n\n"
+                    continue
+                yield f"event: session_delta\ndata: {json.dumps(batch)}\n\n"
+        finally:
+            session_event_bus.unsubscribe(subscription)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
@@ -1,14 +1,20 @@
-from fastapi import APIRouter, HTTPException
+from typing import Optional
+from fastapi import APIRouter, Header, HTTPException
 from api.models import ExecuteRequest, ExecuteResponse
 from api.services.game_service import GameService
-from api.services.session_service import SessionService
+from api.services.session_service import session_service
+from api.services.idempotency_service import (
+    IdempotencyService, IdempotencyKeyConflict, IdempotencyCapacityExceeded,
+    IdempotencyRequestInterrupted
+)
 
 router = APIRouter()
-session_service = SessionService()
 game_service = GameService(session_service)
+idempotency_service = IdempotencyService()
 
 @router.post("/execute", response_model=ExecuteResponse)
-async def execute_code(request: ExecuteRequest):
+async def execute_code(request: ExecuteRequest,
+                       idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key")):
     """Execute user code and provide feedback"""
     try:
         # Validate request
@@ -27,17 +33,27 @@ async def execute_code(request: ExecuteRequest):
         if request.lives < 0:
             raise HTTPException(status_code=400, detail="Lives cannot be negative")
         
-        # Execute code through game service
-        response = await game_service.execute_code(
-            session_id=request.session_id,
-            level=request.level,
-            objective=request.objective,
-            code=request.code,
-            lives=request.lives
+        # Execute code through game service; retries with the same key reuse the first response
+        response = await idempotency_service.run(
+            idempotency_key,
+            request.model_dump(),
+            lambda: game_service.execute_code(
+                session_id=request.session_id,
+                level=request.level,
+                objective=request.objective,
+                code=request.code,
+                lives=request.lives
+            )
         )
         
         return response
         
+    except IdempotencyKeyConflict as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except IdempotencyCapacityExceeded as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except IdempotencyRequestInterrupted as e:
+        raise HTTPException(status_code=409, detail=str(e))
     except HTTPException:
         raise
     except Exception as e:
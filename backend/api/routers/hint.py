@@ -1,14 +1,20 @@
-from fastapi import APIRouter, HTTPException
+from typing import Optional
+from fastapi import APIRouter, Header, HTTPException
 from api.models import HintRequest, HintResponse
 from api.services.game_service import GameService
-from api.services.session_service import SessionService
+from api.services.session_service import session_service
+from api.services.idempotency_service import (
+    IdempotencyService, IdempotencyKeyConflict, IdempotencyCapacityExceeded,
+    IdempotencyRequestInterrupted
+)
 
 router = APIRouter()
-session_service = SessionService()
 game_service = GameService(session_service)
+idempotency_service = IdempotencyService()
 
 @router.post("/hint", response_model=HintResponse)
-async def get_hint(request: HintRequest):
+async def get_hint(request: HintRequest,
+                   idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key")):
     """Get AI-powered hint for current level"""
     try:
         # Validate request
@@ -21,16 +27,26 @@ async def get_hint(request: HintRequest):
         if request.objective not in [1, 2]:
             raise HTTPException(status_code=400, detail="Objective must be 1 or 2")
         
-        # Get hint through game service
-        response = await game_service.get_hint(
-            session_id=request.session_id,
-            level=request.level,
-            objective=request.objective,
-            code=request.code
+        # Get hint through game service; retries with the same key reuse the first response
+        response = await idempotency_service.run(
+            idempotency_key,
+            request.model_dump(),
+            lambda: game_service.get_hint(
+                session_id=request.session_id,
+                level=request.level,
+                objective=request.objective,
+                code=request.code
+            )
         )
         
         return response
         
+    except IdempotencyKeyConflict as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except IdempotencyCapacityExceeded as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except IdempotencyRequestInterrupted as e:
+        raise HTTPException(status_code=409, detail=str(e))
     except HTTPException:
         raise
     except Exception as e:
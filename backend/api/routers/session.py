@@ -1,20 +1,21 @@
+from typing import Optional
 from fastapi import APIRouter, HTTPException
 from api.models import SessionStartResponse
-from api.services.session_service import SessionService
+from api.services.session_service import session_service
 
 router = APIRouter()
-session_service = SessionService()
 
 @router.post("/session/start", response_model=SessionStartResponse)
-async def start_session():
-    """Initialize new game session"""
+async def start_session(class_id: Optional[str] = None):
+    """Initialize new game session, optionally joining a class dashboard feed"""
     try:
-        session = session_service.create_session()
+        session = session_service.create_session(class_id=class_id)
         return SessionStartResponse(
             session_id=session.session_id,
             level=session.current_level,
             objective=session.current_objective,
-            lives=session.lives_remaining
+            lives=session.lives_remaining,
+            class_id=session.class_id
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to create session: {str(e)}")
@@ -54,6 +55,7 @@ async def get_session(session_id: str):
             "current_objective": session.current_objective,
             "lives_remaining": session.lives_remaining,
             "status": session.status,
+            "class_id": session.class_id,
             "created_at": session.created_at,
             "updated_at": session.updated_at,
             "attempts_count": len(session.attempts)
@@ -74,7 +74,7 @@ class GameService:
                 # Generate AI feedback
                 correct_solution = self.game_context.get_solution(level, objective)
                 feedback = await self.zypher_agent.generate_feedback(
-                    level, objective, code, correct_solution
+                    level, objective, code, correct_solution, session.attempts
                 )
                 
                 # Decrement lives and add attempt
@@ -138,7 +138,7 @@ class GameService:
             )
         
         # Generate hint
-        hint = await self.zypher_agent.generate_hint(level, objective, code)
+        hint = await self.zypher_agent.generate_hint(level, objective, code, session.attempts)
         description = self.game_context.get_description(level, objective)
         
         level_context = LevelContext(
@@ -0,0 +1,57 @@
+import os
+import threading
+import time
+
+# Crockford base32: lexicographic order of encoded IDs matches numeric order
+_ENCODING = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+_DECODING = {char: index for index, char in enumerate(_ENCODING)}
+# Two characters per 10-bit chunk halves the work of encoding
+_PAIRS = [_ENCODING[i >> 5] + _ENCODING[i & 31] for i in range(1024)]
+_RANDOM_BITS = 80
+_RANDOM_LIMIT = 1 << _RANDOM_BITS
+ULID_LENGTH = 26
+_TIMESTAMP_LENGTH = 10
+
+class MonotonicULIDGenerator:
+    """Generates 128-bit ULIDs (48-bit ms timestamp + 80 random bits) that sort by creation time"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._last_ms = -1
+        self._last_random = 0
+
+    def new_id(self) -> str:
+        """Return a new ULID, strictly greater than every ID this generator returned before"""
+        with self._lock:
+            now_ms = time.time_ns() // 1_000_000
+            if now_ms <= self._last_ms:
+                # Same millisecond (or clock went backwards): bump the random part
+                now_ms = self._last_ms
+                random_part = self._last_random + 1
+                if random_part >= _RANDOM_LIMIT:
+                    now_ms += 1
+                    random_part = int.from_bytes(os.urandom(10), "big")
+            else:
+                random_part = int.from_bytes(os.urandom(10), "big")
+            self._last_ms = now_ms
+            self._last_random = random_part
+        return encode_ulid((now_ms << _RANDOM_BITS) | random_part)
+
+def encode_ulid(value: int) -> str:
+    """Encode a 128-bit integer as a 26-character Crockford base32 string"""
+    pairs = [_PAIRS[(value >> shift) & 1023] for shift in range(120, -10, -10)]
+    return "".join(pairs)
+
+def ulid_timestamp(ulid: str) -> float:
+    """Unix timestamp in seconds embedded in a ULID"""
+    milliseconds = 0
+    for char in ulid[:_TIMESTAMP_LENGTH]:
+        milliseconds = (milliseconds << 5) | _DECODING[char]
+    return milliseconds / 1000
+
+# Shared generator so IDs stay monotonic across every service instance in the process
+_generator = MonotonicULIDGenerator()
+
+def new_ulid() -> str:
+    """Return a new monotonic ULID from the process-wide generator"""
+    return _generator.new_id()
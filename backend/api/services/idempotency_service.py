@@ -0,0 +1,105 @@
+import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+class IdempotencyKeyConflict(Exception):
+    """Raised when an idempotency key is reused with a different request payload"""
+
+class IdempotencyCapacityExceeded(Exception):
+    """Raised when every slot is held by an in-flight request and a new key arrives"""
+
+class IdempotencyRequestInterrupted(Exception):
+    """Raised to retries waiting on an original request that was cancelled"""
+
+@dataclass
+class _IdempotencyEntry:
+    fingerprint: str
+    expires_at: float  # Only meaningful once completed
+    future: "asyncio.Future[Any]"
+
+class IdempotencyService:
+    """Bounded, TTL-expiring store of completed and in-flight responses keyed on Idempotency-Key"""
+
+    def __init__(self, ttl_seconds: float = 300.0, max_entries: int = 10000):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._in_flight: Dict[str, _IdempotencyEntry] = {}
+        # Ordered by completion time, which is also expiry order
+        self._completed: "OrderedDict[str, _IdempotencyEntry]" = OrderedDict()
+
+    @staticmethod
+    def fingerprint(payload: Any) -> str:
+        """Build a stable fingerprint of a request payload"""
+        encoded = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+
+    async def run(self, key: Optional[str], payload: Any,
+                  handler: Callable[[], Awaitable[Any]]) -> Any:
+        """Run handler once per key; retries get the stored or in-flight response"""
+        if not key:
+            return await handler()
+
+        self._evict_expired()
+        fingerprint = self.fingerprint(payload)
+        entry = self._in_flight.get(key) or self._completed.get(key)
+
+        if entry is not None:
+            if entry.fingerprint != fingerprint:
+                raise IdempotencyKeyConflict(
+                    "Idempotency-Key was already used with a different request"
+                )
+            # Completed or in-flight: share the original outcome
+            return await asyncio.shield(entry.future)
+
+        self._make_room()
+        future = asyncio.get_running_loop().create_future()
+        entry = _IdempotencyEntry(fingerprint=fingerprint, expires_at=0.0, future=future)
+        self._in_flight[key] = entry
+
+        try:
+            response = await handler()
+        except BaseException as e:
+            # Failed requests are not cached so the client can retry them
+            del self._in_flight[key]
+            if isinstance(e, Exception):
+                future.set_exception(e)
+            else:
+                # Waiters must not inherit the cancellation; the key is free to retry
+                future.set_exception(IdempotencyRequestInterrupted(
+                    "The original request was interrupted; retry with the same Idempotency-Key"
+                ))
+            # Mark the exception as retrieved in case nobody is waiting on it
+            future.exception()
+            raise
+
+        del self._in_flight[key]
+        entry.expires_at = time.monotonic() + self.ttl_seconds
+        self._completed[key] = entry
+        future.set_result(response)
+        return response
+
+    def _evict_expired(self) -> None:
+        """Drop expired completed entries; completion order matches expiry order"""
+        now = time.monotonic()
+        while self._completed:
+            entry = next(iter(self._completed.values()))
+            if entry.expires_at > now:
+                break
+            self._completed.popitem(last=False)
+
+    def _make_room(self) -> None:
+        """Free a slot for a new key by evicting the oldest completed entries.
+
+        In-flight entries are never evicted, since a retry would then run the
+        handler a second time.
+        """
+        while self._completed and len(self._in_flight) + len(self._completed) >= self.max_entries:
+            self._completed.popitem(last=False)
+        if len(self._in_flight) >= self.max_entries:
+            raise IdempotencyCapacityExceeded(
+                "Too many requests in progress; retry shortly"
+            )
@@ -0,0 +1,167 @@
+import difflib
+from typing import Callable, Dict, List, Optional, Tuple
+from api.models import GameAttempt
+from api.services.game_context_reader import GameContextReader
+
+FEEDBACK_INSTRUCTIONS = """You are a helpful coding tutor for a Mario-style educational game.
+Analyze the user's code attempt and provide encouraging, specific feedback.
+Focus on:
+1. What they did correctly
+2. What specific function they might be missing
+3. Hints about the game mechanics
+4. Encouraging tone suitable for learners
+Keep responses concise and actionable.
+Do not repeat feedback the student has already been given; build on it."""
+
+HINT_INSTRUCTIONS = """You are a helpful coding tutor providing hints for a Mario-style game.
+Based on the current level, objective, and user's partial code:
+1. Provide a gentle nudge in the right direction
+2. Explain relevant game mechanics
+3. Suggest the next logical step
+4. Maintain an encouraging, educational tone
+Do not give away the complete solution.
+Do not repeat feedback the student has already been given; build on it."""
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate (~4 characters per token) used for budgeting"""
+    return (len(text) + 3) // 4
+
+class PromptBuilder:
+    """Builds token-budgeted prompts with a fixed, cacheable prefix and compact attempt history"""
+
+    def __init__(self, game_context: GameContextReader, token_budget: int = 500,
+                 max_history: int = 3, max_feedback_chars: int = 160,
+                 max_line_chars: int = 120, max_history_lines: int = 8):
+        self.game_context = game_context
+        self.token_budget = token_budget
+        self.max_history = max_history
+        self.max_feedback_chars = max_feedback_chars
+        self.max_line_chars = max_line_chars
+        self.max_history_lines = max_history_lines
+        self._prefix_cache: Dict[Tuple[str, int, int], str] = {}
+
+    def build_feedback_prompt(self, level: int, objective: int, user_code: List[str],
+                              correct_solution: List[str],
+                              attempts: Optional[List[GameAttempt]] = None) -> Tuple[str, str]:
+        """Return (system, user) prompts for feedback on an incorrect attempt"""
+        system = self._prefix("feedback", level, objective)
+
+        def render(max_lines: Optional[int]) -> Tuple[str, str]:
+            head = f"Correct solution:\n{self._format_code(correct_solution, max_lines)}"
+            tail = (f"Current attempt:\n{self._format_code(user_code, max_lines)}\n\n"
+                    "Explain what the user did right and what they need to adjust.")
+            return head, tail
+
+        code_lines = max(len(user_code or []), len(correct_solution or []))
+        recent = self._recent_attempts(attempts, level, objective)
+        return system, self._fit(system, render, code_lines, recent)
+
+    def build_hint_prompt(self, level: int, objective: int,
+                          user_code: Optional[List[str]] = None,
+                          attempts: Optional[List[GameAttempt]] = None) -> Tuple[str, str]:
+        """Return (system, user) prompts for a hint on the current objective"""
+        system = self._prefix("hint", level, objective)
+
+        def render(max_lines: Optional[int]) -> Tuple[str, str]:
+            code_text = (f"Current attempt:\n{self._format_code(user_code, max_lines)}"
+                         if user_code else "No code submitted yet.")
+            return "", f"{code_text}\n\nProvide a helpful hint without giving away the complete solution."
+
+        recent = self._recent_attempts(attempts, level, objective)
+        return system, self._fit(system, render, len(user_code or []), recent)
+
+    def _prefix(self, kind: str, level: int, objective: int) -> str:
+        """Static instructions plus level context; identical across calls for caching"""
+        key = (kind, level, objective)
+        prefix = self._prefix_cache.get(key)
+        if prefix is None:
+            instructions = FEEDBACK_INSTRUCTIONS if kind == "feedback" else HINT_INSTRUCTIONS
+            description = self.game_context.get_description(level, objective) or "Unknown"
+            functions = ", ".join(self.game_context.get_available_functions())
+            prefix = (f"{instructions}\n\n"
+                      f"Available functions: {functions}\n"
+                      f"Level {level}, Objective {objective}: {description}")
+            self._prefix_cache[key] = prefix
+        return prefix
+
+    def _fit(self, system: str, render: Callable[[Optional[int]], Tuple[str, str]],
+             code_lines: int, recent: List[Tuple[int, GameAttempt]]) -> str:
+        """Assemble the user prompt within the budget.
+
+        The oldest history goes first; after that the middle of each code block
+        is elided. The closing instruction is always kept.
+        """
+        available = self.token_budget - estimate_tokens(system)
+        head, tail = render(None)
+        history = self._history_lines(recent)
+
+        while recent and estimate_tokens(self._join(head, history, tail)) > available:
+            recent = recent[1:]
+            history = self._history_lines(recent)
+
+        max_lines = code_lines
+        while max_lines > 2 and estimate_tokens(self._join(head, history, tail)) > available:
+            max_lines //= 2
+            head, tail = render(max(max_lines, 2))
+
+        return self._join(head, history, tail)
+
+    def _join(self, head: str, history: List[str], tail: str) -> str:
+        """Join the non-empty prompt sections"""
+        return "\n\n".join(section for section in (head, "\n".join(history), tail) if section)
+
+    def _recent_attempts(self, attempts: Optional[List[GameAttempt]],
+                         level: int, objective: int) -> List[Tuple[int, GameAttempt]]:
+        """Numbered most recent attempts on this objective, oldest first"""
+        relevant = [a for a in attempts or [] if a.level == level and a.objective == objective]
+        first_number = max(1, len(relevant) - self.max_history + 1)
+        return list(enumerate(relevant[-self.max_history:], start=first_number))
+
+    def _history_lines(self, recent: List[Tuple[int, GameAttempt]]) -> List[str]:
+        """The oldest shown attempt in full, later ones as diffs against the one before"""
+        if not recent:
+            return []
+
+        lines = ["Earlier attempts, oldest first (later ones show +added -removed vs the one before):"]
+        previous = None
+        for number, attempt in recent:
+            if previous is None:
+                change = "; ".join(self._trim_lines(attempt.code_submitted, self.max_history_lines))
+            else:
+                change = self._diff(previous, attempt.code_submitted) or "no change"
+            line = f"#{number}: {change}"
+            if attempt.feedback:
+                line += f" | told: {self._clip(attempt.feedback)}"
+            lines.append(line)
+            previous = attempt.code_submitted
+        return lines
+
+    def _diff(self, before: List[str], after: List[str]) -> str:
+        """Line diff between two attempts as '+added -removed' tokens"""
+        changes = []
+        for line in difflib.ndiff(before, after):
+            if line.startswith(("+ ", "- ")):
+                changes.append(f"{line[0]}{line[2:].strip()}")
+        return " ".join(changes)
+
+    def _clip(self, text: str, max_chars: Optional[int] = None) -> str:
+        """Collapse whitespace and cap the length (earlier feedback by default)"""
+        max_chars = max_chars or self.max_feedback_chars
+        text = " ".join(text.split())
+        if len(text) <= max_chars:
+            return text
+        return text[:max_chars - 3].rstrip() + "..."
+
+    def _trim_lines(self, code: Optional[List[str]], max_lines: Optional[int] = None) -> List[str]:
+        """Clip long statements and elide the middle of code longer than max_lines"""
+        lines = [self._clip(line, self.max_line_chars) for line in code or []]
+        if max_lines is None or len(lines) <= max_lines:
+            return lines
+        keep_head = (max_lines + 1) // 2
+        keep_tail = max_lines // 2
+        omitted = len(lines) - keep_head - keep_tail
+        return lines[:keep_head] + [f"... ({omitted} lines omitted) ..."] + lines[len(lines) - keep_tail:]
+
+    def _format_code(self, code: Optional[List[str]], max_lines: Optional[int] = None) -> str:
+        """One statement per line instead of a Python list repr"""
+        return "\n".join(self._trim_lines(code, max_lines))
@@ -0,0 +1,61 @@
+import asyncio
+from typing import Any, Dict, List, Optional, Set
+
+class SessionSubscription:
+    """A subscriber's view of one class, coalescing deltas per session between ticks"""
+
+    def __init__(self, class_id: str, tick_seconds: float):
+        self.class_id = class_id
+        self.tick_seconds = tick_seconds
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._ready = asyncio.Event()
+
+    def push(self, delta: Dict[str, Any]) -> None:
+        """Merge a delta into the pending batch; later fields overwrite earlier ones"""
+        self._pending.setdefault(delta["session_id"], {}).update(delta)
+        self._ready.set()
+
+    async def next_batch(self, timeout: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Wait for deltas, hold for one tick to coalesce, then drain them (empty on timeout)"""
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout)
+        except asyncio.TimeoutError:
+            return []
+
+        await asyncio.sleep(self.tick_seconds)
+        batch = list(self._pending.values())
+        self._pending = {}
+        self._ready.clear()
+        return batch
+
+class SessionEventBus:
+    """In-process publish/subscribe of session delta events, scoped by class"""
+
+    def __init__(self, tick_seconds: float = 0.5):
+        self.tick_seconds = tick_seconds
+        self._subscribers: Dict[str, Set[SessionSubscription]] = {}
+
+    def subscribe(self, class_id: str) -> SessionSubscription:
+        """Register a subscriber for a class"""
+        subscription = SessionSubscription(class_id, self.tick_seconds)
+        self._subscribers.setdefault(class_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: SessionSubscription) -> None:
+        """Remove a subscriber"""
+        subscribers = self._subscribers.get(subscription.class_id)
+        if not subscribers:
+            return
+        subscribers.discard(subscription)
+        if not subscribers:
+            del self._subscribers[subscription.class_id]
+
+    def publish(self, class_id: Optional[str], delta: Dict[str, Any]) -> None:
+        """Deliver a delta to every subscriber of the session's class"""
+        if not class_id:
+            return
+        for subscription in self._subscribers.get(class_id, ()):
+            subscription.push(delta)
+
+# Shared bus so every SessionService instance publishes to the same subscribers
+session_event_bus = SessionEventBus()
@@ -0,0 +1,173 @@
+import heapq
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from itertools import count
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from api.models import GameSession
+
+class _LiveCounter:
+    """Fenwick tree over log positions (1 = live, 0 = stale) for O(log n) next-live lookups"""
+
+    def __init__(self, capacity: int = 64):
+        self._capacity = capacity
+        self._tree = [0] * (capacity + 1)
+        self._bits = bytearray(capacity)
+        self.total = 0
+
+    def set_live(self, position: int) -> None:
+        if position >= self._capacity:
+            self._grow(max(self._capacity * 2, position + 1))
+        self._bits[position] = 1
+        self._add(position, 1)
+
+    def set_stale(self, position: int) -> None:
+        if self._bits[position]:
+            self._bits[position] = 0
+            self._add(position, -1)
+
+    def next_live(self, position: int) -> Optional[int]:
+        """First live position at or after the given one, or None"""
+        rank = self._prefix(position) + 1
+        if rank > self.total:
+            return None
+        # Binary lifting: find the smallest index whose prefix sum reaches rank
+        index = 0
+        step = 1 << (self._capacity.bit_length() - 1)
+        while step:
+            candidate = index + step
+            if candidate <= self._capacity and self._tree[candidate] < rank:
+                index = candidate
+                rank -= self._tree[candidate]
+            step >>= 1
+        return index
+
+    def _prefix(self, position: int) -> int:
+        """Number of live entries before the given position"""
+        total = 0
+        index = min(position, self._capacity)
+        while index > 0:
+            total += self._tree[index]
+            index -= index & -index
+        return total
+
+    def _add(self, position: int, delta: int) -> None:
+        self.total += delta
+        index = position + 1
+        while index <= self._capacity:
+            self._tree[index] += delta
+            index += index & -index
+
+    def _grow(self, capacity: int) -> None:
+        """Rebuild at a larger capacity in O(capacity)"""
+        bits = self._bits + bytearray(capacity - self._capacity)
+        tree = [0] * (capacity + 1)
+        for index in range(1, capacity + 1):
+            tree[index] += bits[index - 1]
+            parent = index + (index & -index)
+            if parent <= capacity:
+                tree[parent] += tree[index]
+        self._capacity, self._tree, self._bits = capacity, tree, bits
+
+class _UpdateLog:
+    """Append-only log of (sequence, updated_at, session_id) for one (status, level) bucket"""
+
+    def __init__(self):
+        self.seqs: List[int] = []
+        self.stamps: List[float] = []
+        self.session_ids: List[str] = []
+        self.live = _LiveCounter()
+
+    def append(self, seq: int, stamp: float, session_id: str) -> int:
+        position = len(self.seqs)
+        self.seqs.append(seq)
+        # Keep stamps sorted even if the wall clock steps backwards
+        self.stamps.append(max(stamp, self.stamps[-1]) if self.stamps else stamp)
+        self.session_ids.append(session_id)
+        self.live.set_live(position)
+        return position
+
+    def start(self, after_seq: Optional[int], updated_since: Optional[float]) -> int:
+        """First log position past the cursor and at or after updated_since"""
+        position = bisect_right(self.seqs, after_seq) if after_seq is not None else 0
+        if updated_since is not None:
+            position = max(position, bisect_left(self.stamps, updated_since))
+        return position
+
+class SessionUpdateIndex:
+    """Secondary index of sessions by (status, level), ordered by last update.
+
+    Every update appends to the session's bucket log and marks its previous
+    entry stale. A Fenwick tree over live entries lets a scan jump past stale
+    entries in O(log n), so a page costs O(page size * log n) however much
+    churn came before it. Logs are compacted once stale entries outnumber
+    live ones, which keeps memory bounded at amortised O(1) per update.
+    """
+
+    def __init__(self):
+        self._sequence = count(1)
+        self._buckets: Dict[Tuple[str, int], _UpdateLog] = {}
+        # session_id -> (bucket key, seq, log position) of its live entry
+        self._current: Dict[str, Tuple[Tuple[str, int], int, int]] = {}
+
+    def touch(self, session: GameSession) -> None:
+        """Record that a session changed; moves it to the end of its bucket"""
+        self.remove(session.session_id)
+        key = (session.status, session.current_level)
+        seq = next(self._sequence)
+        position = self._buckets.setdefault(key, _UpdateLog()).append(
+            seq, session.updated_at.timestamp(), session.session_id
+        )
+        self._current[session.session_id] = (key, seq, position)
+
+    def remove(self, session_id: str) -> None:
+        """Drop a session from the index; its log entry is marked stale"""
+        previous = self._current.pop(session_id, None)
+        if previous is None:
+            return
+        key, _, position = previous
+        bucket = self._buckets[key]
+        bucket.live.set_stale(position)
+        if len(bucket.seqs) > 64 and bucket.live.total * 2 < len(bucket.seqs):
+            self._compact(key, bucket)
+
+    def iter(self, statuses: Optional[Iterable[str]] = None, levels: Optional[Iterable[int]] = None,
+             updated_since: Optional[datetime] = None,
+             after_seq: Optional[int] = None) -> Iterator[Tuple[int, str]]:
+        """Yield (sequence, session_id) for matching sessions, least recently updated first"""
+        status_filter = set(statuses) if statuses is not None else None
+        level_filter = set(levels) if levels is not None else None
+        since = updated_since.timestamp() if updated_since is not None else None
+
+        streams = [
+            self._scan(key, bucket, bucket.start(after_seq, since))
+            for key, bucket in self._buckets.items()
+            if (status_filter is None or key[0] in status_filter)
+            and (level_filter is None or key[1] in level_filter)
+        ]
+        return heapq.merge(*streams)
+
+    def _scan(self, key: Tuple[str, int], bucket: _UpdateLog, position: int) -> Iterator[Tuple[int, str]]:
+        """Walk the live entries of a bucket log from a position"""
+        while True:
+            position = bucket.live.next_live(position)
+            if position is None or position >= len(bucket.seqs):
+                return
+            seq = bucket.seqs[position]
+            session_id = bucket.session_ids[position]
+            position += 1
+            # A scan that outlives a compaction still sees the old log; skip moved sessions
+            current = self._current.get(session_id)
+            if current is not None and current[:2] == (key, seq):
+                yield seq, session_id
+
+    def _compact(self, key: Tuple[str, int], bucket: _UpdateLog) -> None:
+        """Rebuild a bucket log with only its live entries"""
+        compacted = _UpdateLog()
+        position = bucket.live.next_live(0)
+        while position is not None and position < len(bucket.seqs):
+            session_id = bucket.session_ids[position]
+            seq = bucket.seqs[position]
+            new_position = compacted.append(seq, bucket.stamps[position], session_id)
+            self._current[session_id] = (key, seq, new_position)
+            position = bucket.live.next_live(position + 1)
+        self._buckets[key] = compacted
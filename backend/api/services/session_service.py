@@ -1,18 +1,30 @@
-import uuid
+import time
 from datetime import datetime
-from typing import Dict, Optional
+from itertools import islice
+from typing import Dict, Iterator, List, Optional, Tuple
 from api.models import GameSession, GameAttempt
+from api.services.id_generator import new_ulid, ulid_timestamp
+from api.services.session_index import SessionUpdateIndex
+from api.services.session_event_bus import SessionEventBus, session_event_bus
 
 class SessionService:
     """Service for managing game sessions with in-memory storage"""
     
-    def __init__(self):
+    def __init__(self, event_bus: Optional[SessionEventBus] = None):
         self._sessions: Dict[str, GameSession] = {}
+        self.event_bus = event_bus or session_event_bus
+        # Creation-ordered index: ULID order keys are monotonic, so appends keep it sorted
+        self._order: List[str] = []
+        self._order_head = 0  # Entries before this position have expired
+        self._order_sessions: Dict[str, str] = {}
+        # Secondary index by (status, level), ordered by last update, for admin listing
+        self._update_index = SessionUpdateIndex()
         self._initialize_test_sessions()
     
-    def create_session(self) -> GameSession:
+    def create_session(self, class_id: Optional[str] = None) -> GameSession:
         """Create a new game session"""
-        session_id = f"sess_{uuid.uuid4().hex[:8]}"
+        order_key = new_ulid()
+        session_id = f"sess_{order_key}"
         session = GameSession(
             session_id=session_id,
             current_level=1,
@@ -21,9 +33,13 @@ class SessionService:
             created_at=datetime.now(),
             updated_at=datetime.now(),
             status="active",
-            attempts=[]
+            attempts=[],
+            class_id=class_id
         )
-        self._sessions[session_id] = session
+        self._register(session, order_key)
+        self._publish(session, "created", level=session.current_level,
+                      objective=session.current_objective, lives=session.lives_remaining,
+                      status=session.status)
         return session
     
     def get_session(self, session_id: str) -> Optional[GameSession]:
@@ -42,6 +58,10 @@ class SessionService:
                 setattr(session, key, value)
         
         session.updated_at = datetime.now()
+        self._update_index.touch(session)
+        self._publish(session, "updated", level=session.current_level,
+                      objective=session.current_objective, lives=session.lives_remaining,
+                      status=session.status)
         return session
     
     def add_attempt(self, session_id: str, level: int, objective: int, 
@@ -52,7 +72,7 @@ class SessionService:
             return None
         
         attempt = GameAttempt(
-            attempt_id=f"att_{uuid.uuid4().hex[:6]}",
+            attempt_id=f"att_{new_ulid()}",
             level=level,
             objective=objective,
             code_submitted=code_submitted,
@@ -63,6 +83,9 @@ class SessionService:
         
         session.attempts.append(attempt)
         session.updated_at = datetime.now()
+        self._update_index.touch(session)
+        self._publish(session, "attempt", attempts=len(session.attempts),
+                      last_attempt_correct=is_correct)
         return session
     
     def decrement_lives(self, session_id: str) -> Optional[GameSession]:
@@ -77,6 +100,8 @@ class SessionService:
         if session.lives_remaining == 0:
             session.status = "game_over"
         
+        self._update_index.touch(session)
+        self._publish(session, "lives", lives=session.lives_remaining, status=session.status)
         return session
     
     def reset_session(self, session_id: str) -> Optional[GameSession]:
@@ -92,6 +117,10 @@ class SessionService:
         session.attempts = []
         session.updated_at = datetime.now()
         
+        self._update_index.touch(session)
+        self._publish(session, "reset", level=session.current_level,
+                      objective=session.current_objective, lives=session.lives_remaining,
+                      status=session.status, attempts=0)
         return session
     
     def advance_objective(self, session_id: str) -> Optional[GameSession]:
@@ -113,11 +142,81 @@ class SessionService:
             session.status = "completed"
         
         session.updated_at = datetime.now()
+        self._update_index.touch(session)
+        self._publish(session, "advanced", level=session.current_level,
+                      objective=session.current_objective, lives=session.lives_remaining,
+                      status=session.status)
         return session
     
-    def get_all_sessions(self) -> Dict[str, GameSession]:
-        """Get all sessions (for debugging)"""
-        return self._sessions.copy()
+    def iter_sessions(self, status: Optional[str] = None, level: Optional[int] = None,
+                      updated_since: Optional[datetime] = None,
+                      after: Optional[str] = None) -> Iterator[Tuple[str, GameSession]]:
+        """Yield (cursor, session) pairs, least recently updated first, resuming after a cursor"""
+        after_seq = int(after) if after else None
+        matches = self._update_index.iter(
+            statuses=[status] if status else None,
+            levels=[level] if level is not None else None,
+            updated_since=updated_since,
+            after_seq=after_seq
+        )
+        for seq, session_id in matches:
+            session = self._sessions.get(session_id)
+            if session:
+                yield str(seq), session
+    
+    def list_sessions(self, status: Optional[str] = None, level: Optional[int] = None,
+                      updated_since: Optional[datetime] = None, cursor: Optional[str] = None,
+                      limit: int = 50) -> Tuple[List[GameSession], Optional[str]]:
+        """Get one page of sessions plus the cursor for the next page (None on the last page)"""
+        entries = list(islice(
+            self.iter_sessions(status=status, level=level, updated_since=updated_since, after=cursor),
+            limit + 1
+        ))
+        page = [session for _, session in entries[:limit]]
+        next_cursor = entries[limit - 1][0] if len(entries) > limit else None
+        return page, next_cursor
+    
+    def expire_sessions(self, max_age_seconds: float) -> int:
+        """Remove sessions created more than max_age_seconds ago, oldest first"""
+        cutoff = time.time() - max_age_seconds
+        removed = 0
+        while self._order_head < len(self._order):
+            order_key = self._order[self._order_head]
+            if ulid_timestamp(order_key) >= cutoff:
+                break
+            session_id = self._order_sessions.pop(order_key)
+            session = self._sessions.pop(session_id, None)
+            self._update_index.remove(session_id)
+            if session:
+                self._publish(session, "expired")
+            self._order_head += 1
+            removed += 1
+        
+        # Reclaim the expired prefix once it dominates the index
+        if self._order_head > 1024 and self._order_head * 2 > len(self._order):
+            self._order = self._order[self._order_head:]
+            self._order_head = 0
+        return removed
+    
+    def _register(self, session: GameSession, order_key: Optional[str] = None) -> None:
+        """Store a session; with an order key it joins the creation-ordered expiry index"""
+        self._sessions[session.session_id] = session
+        if order_key:
+            self._order.append(order_key)
+            self._order_sessions[order_key] = session.session_id
+        self._update_index.touch(session)
+    
+    def _publish(self, session: GameSession, event: str, **fields) -> None:
+        """Publish a compact delta of the changed fields to the session's class feed"""
+        if not session.class_id:
+            return
+        delta = {
+            "session_id": session.session_id,
+            "event": event,
+            "updated_at": session.updated_at.isoformat(),
+        }
+        delta.update(fields)
+        self.event_bus.publish(session.class_id, delta)
     
     def _initialize_test_sessions(self):
         """Initialize dummy test sessions for testing purposes"""
@@ -132,7 +231,7 @@ class SessionService:
             status="active",
             attempts=[]
         )
-        self._sessions["test_session_123"] = test_session_1
+        self._register(test_session_1)
         
         # Create test session 2
         test_session_2 = GameSession(
@@ -145,7 +244,7 @@ class SessionService:
             status="active",
             attempts=[]
         )
-        self._sessions["test_session_456"] = test_session_2
+        self._register(test_session_2)
         
         # Create test session 3 (level 2)
         test_session_3 = GameSession(
@@ -158,4 +257,7 @@ class SessionService:
             status="active",
             attempts=[]
         )
-        self._sessions["test_session_789"] = test_session_3
\ No newline at end of file
+        self._register(test_session_3)
+
+# Shared store so every router and GameService sees the same sessions
+session_service = SessionService()
@@ -1,7 +1,9 @@
 import os
 from typing import List, Optional
 from anthropic import Anthropic
+from api.models import GameAttempt
 from api.services.game_context_reader import GameContextReader
+from api.services.prompt_builder import PromptBuilder
 
 class ZypherAgentService:
     """Service for AI-powered feedback and hints using Anthropic Claude"""
@@ -9,94 +11,55 @@ class ZypherAgentService:
     def __init__(self):
         self.client = Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
         self.game_context = GameContextReader()
-        
-        # Agent instructions for feedback generation
-        self.feedback_instructions = """
-You are a helpful coding tutor for a Mario-style educational game. 
-Analyze the user's code attempt and provide encouraging, specific feedback.
-Focus on:
-1. What they did correctly
-2. What specific function they might be missing
-3. Hints about the game mechanics
-4. Encouraging tone suitable for learners
-Keep responses concise and actionable.
-"""
-        
-        # Agent instructions for hint generation
-        self.hint_instructions = """
-You are a helpful coding tutor providing hints for a Mario-style game.
-Based on the current level, objective, and user's partial code:
-1. Provide a gentle nudge in the right direction
-2. Explain relevant game mechanics
-3. Suggest the next logical step
-4. Maintain an encouraging, educational tone
-Do not give away the complete solution.
-"""
+        self.prompt_builder = PromptBuilder(self.game_context)
+        self.model = "claude-3-haiku-20240307"
     
     async def generate_feedback(self, level: int, objective: int, 
-                              user_code: List[str], correct_solution: List[str]) -> str:
+                              user_code: List[str], correct_solution: List[str],
+                              attempts: Optional[List[GameAttempt]] = None) -> str:
         """Generate AI feedback for incorrect code attempts"""
         try:
-            level_context = self.game_context.get_level_context(level, objective)
-            
-            prompt = f"""
-{self.feedback_instructions}
-
-Level {level}, Objective {objective}: {level_context['description']}
-User's code attempt: {user_code}
-Correct solution: {correct_solution}
-Available functions: {self.game_context.get_available_functions()}
-
-Provide encouraging feedback explaining what the user did right and what they need to adjust.
-"""
-            
-            response = self.client.messages.create(
-                model="claude-3-haiku-20240307",
-                max_tokens=200,
-                messages=[
-                    {"role": "user", "content": prompt}
-                ]
+            system, prompt = self.prompt_builder.build_feedback_prompt(
+                level, objective, user_code, correct_solution, attempts
             )
-            
-            return response.content[0].text.strip()
+            return self._complete("feedback", system, prompt, max_tokens=200)
             
         except Exception as e:
             print(f"Error generating feedback: {e}")
             return "Great attempt! Try reviewing the available functions and think about what actions Mario needs to take to overcome this challenge."
     
     async def generate_hint(self, level: int, objective: int, 
-                          user_code: Optional[List[str]] = None) -> str:
+                          user_code: Optional[List[str]] = None,
+                          attempts: Optional[List[GameAttempt]] = None) -> str:
         """Generate AI hints for current level and objective"""
         try:
-            level_context = self.game_context.get_level_context(level, objective)
-            
-            user_code_text = f"Current code attempt: {user_code}" if user_code else "No code submitted yet."
-            
-            prompt = f"""
-{self.hint_instructions}
-
-Level {level}, Objective {objective}: {level_context['description']}
-{user_code_text}
-Available functions: {self.game_context.get_available_functions()}
-
-Provide a helpful hint without giving away the complete solution.
-"""
-            
-            response = self.client.messages.create(
-                model="claude-3-haiku-20240307",
-                max_tokens=150,
-                messages=[
-                    {"role": "user", "content": prompt}
-                ]
+            system, prompt = self.prompt_builder.build_hint_prompt(
+                level, objective, user_code, attempts
             )
-            
-            return response.content[0].text.strip()
+            return self._complete("hint", system, prompt, max_tokens=150)
             
         except Exception as e:
             print(f"Error generating hint: {e}")
             # Fallback hints based on level and objective
             return self._get_fallback_hint(level, objective)
     
+    def _complete(self, kind: str, system: str, prompt: str, max_tokens: int) -> str:
+        """Send a prompt with its fixed system prefix and log token usage"""
+        response = self.client.messages.create(
+            model=self.model,
+            max_tokens=max_tokens,
+            system=system,
+            messages=[
+                {"role": "user", "content": prompt}
+            ]
+        )
+        
+        usage = getattr(response, "usage", None)
+        if usage is not None:
+            print(f"Zypher {kind} tokens: prompt={usage.input_tokens} completion={usage.output_tokens}")
+        
+        return response.content[0].text.strip()
+    
     def _get_fallback_hint(self, level: int, objective: int) -> str:
         """Provide fallback hints when AI service is unavailable"""
         fallback_hints = {
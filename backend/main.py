@@ -1,7 +1,8 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from api.routers import execute, hint, session, health
-from api.services.session_service import SessionService
+from api.routers import execute, hint, session, health, dashboard, admin
+from api.services.session_service import session_service
+import asyncio
 import os
 from dotenv import load_dotenv
 
@@ -24,24 +25,40 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Initialize session service
-session_service = SessionService()
+# Session expiry: sessions older than the max age are dropped oldest first
+SESSION_MAX_AGE_SECONDS = float(os.getenv("SESSION_MAX_AGE_SECONDS", "86400"))
+SESSION_EXPIRY_INTERVAL_SECONDS = float(os.getenv("SESSION_EXPIRY_INTERVAL_SECONDS", "60"))
+
+async def expire_sessions_periodically():
+    """Background task that prunes expired sessions"""
+    while True:
+        await asyncio.sleep(SESSION_EXPIRY_INTERVAL_SECONDS)
+        try:
+            removed = session_service.expire_sessions(SESSION_MAX_AGE_SECONDS)
+            if removed:
+                print(f"Expired {removed} sessions")
+        except Exception as e:
+            print(f"Error expiring sessions: {e}")
 
 # Include routers
 app.include_router(health.router, prefix="", tags=["health"])
 app.include_router(execute.router, prefix="/api/v1", tags=["execute"])
 app.include_router(hint.router, prefix="/api/v1", tags=["hint"])
 app.include_router(session.router, prefix="/api/v1", tags=["session"])
+app.include_router(dashboard.router, prefix="/api/v1", tags=["dashboard"])
+app.include_router(admin.router, prefix="/api/v1", tags=["admin"])
 
 @app.on_event("startup")
 async def startup_event():
     """Initialize services on startup"""
     print("Mario Coding Game Backend starting up...")
+    app.state.expiry_task = asyncio.create_task(expire_sessions_periodically())
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Cleanup on shutdown"""
     print("Mario Coding Game Backend shutting down...")
+    app.state.expiry_task.cancel()
 
 if __name__ == "__main__":
     import uvicorn